@@ -29,4 +29,14 @@ GO
 ALTER TABLE [dbo].[models] ADD  CONSTRAINT [DF_models_last_update_date]  DEFAULT (getdate()) FOR [last_update_date]
 GO
 
+/****** Object:  Index [IX_models_model_name_model_version_location] ******/
+CREATE NONCLUSTERED INDEX [IX_models_model_name_model_version_location] ON [dbo].[models]
+(
+	[model_name] ASC,
+	[model_version] ASC,
+	[location] ASC
+)
+INCLUDE([lifecycle_status],[deprecation_date]) WITH (STATISTICS_NORECOMPUTE = OFF, DROP_EXISTING = OFF, ONLINE = OFF, OPTIMIZE_FOR_SEQUENTIAL_KEY = OFF) ON [PRIMARY]
+GO
+
 